@@ -0,0 +1,122 @@
+import pandas as pd
+
+# ======================================================
+# FILTER INDEX & CHART AGGREGATES
+# ======================================================
+
+def filter_index(df):
+    months = (
+        df[["Month", "Month_Num"]]
+        .dropna()
+        .drop_duplicates()
+        .sort_values("Month_Num")["Month"]
+        .tolist()
+    )
+
+    week_timeline = (
+        df[["Month", "Time_Order", "Time_Label"]]
+        .drop_duplicates()
+        .sort_values("Time_Order")
+    )
+
+    return {
+        "clients": sorted(df["Client"].unique()),
+        "assignees": sorted(df["Assignee"].unique()),
+        "months": months,
+        "week_timeline": week_timeline
+    }
+
+
+def week_order_for(index, months):
+    week_timeline = index["week_timeline"]
+    return week_timeline[week_timeline["Month"].isin(months)]["Time_Label"].tolist()
+
+
+def apply_filters(df, clients, assignees, months, selected_weeks):
+    return df[
+        (df["Client"].isin(clients)) &
+        (df["Assignee"].isin(assignees)) &
+        (df["Month"].isin(months)) &
+        (df["Time_Label"].isin(selected_weeks))
+    ]
+
+
+def chart_aggregates(filtered_df, top_n, week_order):
+    monthly_assignee = (
+        filtered_df
+        .groupby("Assignee", as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Effort", ascending=False)
+    )
+
+    monthly_client = (
+        filtered_df
+        .groupby(["Month", "Month_Num", "Client"], as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Month_Num")
+    )
+
+    # Ensure chronological month ordering
+    month_order_sorted = (
+        monthly_client[["Month", "Month_Num"]]
+        .drop_duplicates()
+        .sort_values("Month_Num")["Month"]
+        .tolist()
+    )
+
+    monthly_client["Month"] = pd.Categorical(
+        monthly_client["Month"],
+        categories=month_order_sorted,
+        ordered=True
+    )
+
+    assignee_client = (
+        filtered_df
+        .groupby("Client", as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Effort", ascending=False)
+    )
+
+    weekly = (
+        filtered_df
+        .groupby(["Time_Order", "Time_Label", "Client"], as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Time_Order")
+    )
+
+    # Top N clients
+    top_clients = (
+        filtered_df.groupby("Client")["Effort"]
+        .sum()
+        .sort_values(ascending=False)
+        .head(top_n)
+        .index
+    )
+
+    weekly = weekly[weekly["Client"].isin(top_clients)]
+
+    # Force chronological categorical ordering
+    weekly["Time_Label"] = pd.Categorical(
+        weekly["Time_Label"],
+        categories=week_order,
+        ordered=True
+    )
+
+    pivot = (
+        weekly
+        .pivot_table(
+            values="Effort",
+            index="Client",
+            columns="Time_Label",
+            fill_value=0
+        )
+        .reindex(columns=week_order)
+    )
+
+    return {
+        "monthly_assignee": monthly_assignee,
+        "monthly_client": monthly_client,
+        "assignee_client": assignee_client,
+        "weekly": weekly,
+        "pivot": pivot
+    }
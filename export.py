@@ -0,0 +1,176 @@
+import argparse
+import pyarrow as pa
+import pyarrow.parquet as pq
+from io import BytesIO
+
+# Rows per CSV chunk / Parquet row group / Arrow record batch
+CHUNK_ROWS = 50_000
+
+EXPORT_FORMATS = {
+    "CSV": {"ext": "csv", "mime": "text/csv"},
+    "Parquet": {"ext": "parquet", "mime": "application/vnd.apache.parquet"},
+    "Arrow IPC": {"ext": "arrow", "mime": "application/vnd.apache.arrow.file"},
+}
+
+
+class _ChunkSink:
+    """Write-only file object that hands out bytes as they are written.
+
+    pyarrow writers need a sink with a monotonically increasing tell(), so the
+    position is tracked separately from the buffered bytes we drain.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _prepare(chunk):
+    # Categoricals (used for chart ordering) are written as plain values
+    for col in chunk.select_dtypes(include="category").columns:
+        chunk = chunk.assign(**{col: chunk[col].astype(chunk[col].cat.categories.dtype)})
+
+    # Object columns can mix ints and strings across sheets (e.g. Ticket Number)
+    for col in chunk.select_dtypes(include="object").columns:
+        chunk = chunk.assign(**{col: chunk[col].astype("string")})
+
+    return chunk
+
+
+def _iter_arrow_tables(df, chunk_rows):
+    # Schema comes from the empty frame so every slice is written with the same types
+    schema = pa.Schema.from_pandas(_prepare(df.iloc[:0]), preserve_index=False)
+
+    def tables():
+        for start in range(0, len(df), chunk_rows):
+            chunk = _prepare(df.iloc[start:start + chunk_rows])
+            yield pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+    return schema, tables()
+
+
+# ======================================================
+# CHUNKED WRITERS
+# ======================================================
+
+def iter_csv(df, chunk_rows=CHUNK_ROWS):
+    yield df.head(0).to_csv(index=False).encode("utf-8")
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
+
+def iter_parquet(df, chunk_rows=CHUNK_ROWS):
+    schema, tables = _iter_arrow_tables(df, chunk_rows)
+    sink = _ChunkSink()
+
+    with pq.ParquetWriter(sink, schema) as writer:
+        for table in tables:
+            writer.write_table(table, row_group_size=chunk_rows)
+            data = sink.drain()
+            if data:
+                yield data
+
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def iter_arrow(df, chunk_rows=CHUNK_ROWS):
+    schema, tables = _iter_arrow_tables(df, chunk_rows)
+    sink = _ChunkSink()
+
+    with pa.ipc.new_file(sink, schema) as writer:
+        for table in tables:
+            writer.write_table(table, max_chunksize=chunk_rows)
+            data = sink.drain()
+            if data:
+                yield data
+
+    data = sink.drain()
+    if data:
+        yield data
+
+
+_WRITERS = {
+    "CSV": iter_csv,
+    "Parquet": iter_parquet,
+    "Arrow IPC": iter_arrow,
+}
+
+
+def iter_export(df, fmt, chunk_rows=CHUNK_ROWS):
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    return _WRITERS[fmt](df, chunk_rows)
+
+
+def write_export(df, fmt, file, chunk_rows=CHUNK_ROWS):
+    for data in iter_export(df, fmt, chunk_rows):
+        file.write(data)
+
+
+def export_file(df, fmt, chunk_rows=CHUNK_ROWS):
+    file = BytesIO()
+    write_export(df, fmt, file, chunk_rows)
+    file.seek(0)
+    return file
+
+
+def export_filename(name, fmt):
+    stem = "_".join(name.lower().split())
+    return f"{stem}.{EXPORT_FORMATS[fmt]['ext']}"
+
+
+def export_format_for(path):
+    for fmt, spec in EXPORT_FORMATS.items():
+        if path.lower().endswith("." + spec["ext"]):
+            return fmt
+
+    raise ValueError(f"Cannot infer export format from: {path}")
+
+
+# ======================================================
+# CLI: parse a workbook once and write it for other tools
+# ======================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Parse a ticket workbook and write the dataset as CSV, Parquet or Arrow IPC."
+    )
+    parser.add_argument("workbook", help="Path to Customer_Ticket_Status.xlsx")
+    parser.add_argument("output", help="Output path ending in .csv, .parquet or .arrow")
+    args = parser.parse_args(argv)
+
+    from loader import parse_workbook
+
+    df = parse_workbook(args.workbook)
+    with open(args.output, "wb") as file:
+        write_export(df, export_format_for(args.output), file)
+
+
+if __name__ == "__main__":
+    main()
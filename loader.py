@@ -0,0 +1,95 @@
+import pandas as pd
+import re
+
+# ======================================================
+# WORKBOOK PARSING
+# ======================================================
+
+def parse_workbook(file):
+    xls = pd.ExcelFile(file)
+    final_rows = []
+
+    for sheet_name in xls.sheet_names:
+        df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
+
+        current_month = None
+        current_week = None
+        columns = None
+
+        for _, row in df.iterrows():
+            row_str = row.fillna("").astype(str).str.strip()
+            row_text = " ".join(row_str)
+
+            # Detect Month
+            month_match = re.search(
+                r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',
+                row_text,
+                re.IGNORECASE
+            )
+            if month_match:
+                current_month = month_match.group().capitalize()
+                continue
+
+            # Detect Week
+            week_match = re.search(r'\bWeek\s*\d+\b', row_text, re.IGNORECASE)
+            if week_match:
+                current_week = re.sub(r'\s+', '', week_match.group()).capitalize()
+                continue
+
+            # Detect Header
+            if "Ticket Number" in row_str.values:
+                columns = row_str.tolist()
+                continue
+
+            if columns is None:
+                continue
+
+            row_dict = dict(zip(columns, row.tolist()))
+
+            assignee_raw = row_dict.get("Assignee")
+            effort = pd.to_numeric(row_dict.get("Effort"), errors="coerce")
+
+            if pd.notna(assignee_raw) and str(assignee_raw).strip() != "" and pd.notna(effort):
+
+                # Convert to string and clean
+                assignee_raw = str(assignee_raw).strip()
+
+                # Split multiple names (/, comma)
+                assignee_list = re.split(r'[\/,]', assignee_raw)
+
+                for name in assignee_list:
+
+                    name = name.strip()
+                    if not name:
+                        continue
+
+                    # Take first word only
+                    first_name = name.split()[0]
+
+                    # Standardize case (vinay -> Vinay)
+                    first_name = first_name.lower().capitalize()
+
+                    final_rows.append({
+                        "Ticket Number": row_dict.get("Ticket Number"),
+                        "Assignee": first_name,
+                        "Effort": effort,
+                        "Month": current_month,
+                        "Week": current_week,
+                        "Client": sheet_name
+                    })
+
+    final_df = pd.DataFrame(final_rows)
+
+    month_order = {
+        "January": 1, "February": 2, "March": 3,
+        "April": 4, "May": 5, "June": 6,
+        "July": 7, "August": 8, "September": 9,
+        "October": 10, "November": 11, "December": 12
+    }
+
+    final_df["Month_Num"] = final_df["Month"].map(month_order)
+    final_df["Week_Num"] = final_df["Week"].str.extract(r'(\d+)').astype(int)
+    final_df["Time_Order"] = final_df["Month_Num"] * 10 + final_df["Week_Num"]
+    final_df["Time_Label"] = final_df["Month"] + " " + final_df["Week"]
+
+    return final_df
@@ -1,19 +1,5 @@
 import smtplib
 from email.message import EmailMessage
-from reportlab.platypus import PageBreak
-from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer,
-        Image, Table, TableStyle
-    )
-from datetime import datetime
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import Paragraph
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle
-from reportlab.lib.units import inch
 
 def generate_pdf_report(
     fig_bar,
@@ -27,7 +13,7 @@ def generate_pdf_report(
     weeks,
     filtered_df
 ):
-
+    # ReportLab is imported here so it is only loaded when a report is requested
     from reportlab.platypus import (
         SimpleDocTemplate, Paragraph, Spacer,
         Image, Table, TableStyle, PageBreak
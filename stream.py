@@ -3,115 +3,148 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import re
+import os
+import logging
+import threading
+from functools import partial
 from mail import generate_pdf_report,send_email_report
+from export import EXPORT_FORMATS, export_file, export_filename
+from loader import parse_workbook
+from aggregates import filter_index, week_order_for, apply_filters, chart_aggregates
 
 st.set_page_config(layout="wide")
 
+logger = logging.getLogger(__name__)
+
 # ======================================================
 # DATA LOADING (CACHED)
 # ======================================================
 
-@st.cache_data
-def load_data(file):
-    xls = pd.ExcelFile(file)
-    final_rows = []
-
-    for sheet_name in xls.sheet_names:
-        df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
-
-        current_month = None
-        current_week = None
-        columns = None
-
-        for _, row in df.iterrows():
-            row_str = row.fillna("").astype(str).str.strip()
-            row_text = " ".join(row_str)
-
-            # Detect Month
-            month_match = re.search(
-                r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',
-                row_text,
-                re.IGNORECASE
-            )
-            if month_match:
-                current_month = month_match.group().capitalize()
-                continue
-
-            # Detect Week
-            week_match = re.search(r'\bWeek\s*\d+\b', row_text, re.IGNORECASE)
-            if week_match:
-                current_week = re.sub(r'\s+', '', week_match.group()).capitalize()
-                continue
+# `modified` keys preloaded paths on the file's mtime so a refreshed workbook is re-parsed
+@st.cache_data(max_entries=8)
+def load_data(file, modified=None):
+    return parse_workbook(file)
 
-            # Detect Header
-            if "Ticket Number" in row_str.values:
-                columns = row_str.tolist()
-                continue
 
-            if columns is None:
-                continue
+# ======================================================
+# FILTER INDEX & AGGREGATES (CACHED)
+# ======================================================
 
-            row_dict = dict(zip(columns, row.tolist()))
+DEFAULT_TOP_N = 8
 
-            assignee_raw = row_dict.get("Assignee")
-            effort = pd.to_numeric(row_dict.get("Effort"), errors="coerce")
+# `dataset_key` identifies the workbook so the (unhashed) frames don't need hashing per rerun
+@st.cache_data(max_entries=8)
+def build_filter_index(_df, dataset_key):
+    return filter_index(_df)
 
-            if pd.notna(assignee_raw) and str(assignee_raw).strip() != "" and pd.notna(effort):
 
-                # Convert to string and clean
-                assignee_raw = str(assignee_raw).strip()
+# `filters` is only part of the cache key: `_filtered_df` must be the result of
+# apply_filters(df, *filters) for the workbook identified by `dataset_key`
+@st.cache_data(max_entries=64)
+def build_aggregates(_filtered_df, dataset_key, filters, top_n, week_order):
+    return chart_aggregates(_filtered_df, top_n, week_order)
 
-                # Split multiple names (/, comma)
-                assignee_list = re.split(r'[\/,]', assignee_raw)
 
-                for name in assignee_list:
+# ======================================================
+# WARM START (PRELOADED WORKBOOKS)
+# ======================================================
 
-                    name = name.strip()
-                    if not name:
-                        continue
+# Paths separated by os.pathsep, e.g.
+# DASHBOARD_PRELOAD_WORKBOOKS=/data/Customer_Ticket_Status.xlsx
+PRELOAD_WORKBOOKS = tuple(
+    path.strip()
+    for path in os.environ.get("DASHBOARD_PRELOAD_WORKBOOKS", "").split(os.pathsep)
+    if path.strip()
+)
+
+def preload_workbooks(paths, failed):
+    for path in paths:
+        if not os.path.isfile(path):
+            logger.warning("Preload workbook not found, skipping: %s", path)
+            continue
 
-                    # Take first word only
-                    first_name = name.split()[0]
+        modified = os.path.getmtime(path)
+        try:
+            # Fill the data, filter index and default-filter aggregate caches
+            # using the same keys as the UI below
+            dataset_key = (path, modified)
+            df = load_data(path, dataset_key[1])
+            index = build_filter_index(df, dataset_key)
+            week_order = week_order_for(index, index["months"])
+
+            filters = (index["clients"], index["assignees"], index["months"], week_order)
+            default_df = apply_filters(df, *filters)
+            build_aggregates(default_df, dataset_key, filters, DEFAULT_TOP_N, week_order)
+        except Exception:
+            logger.exception("Failed to preload workbook: %s", path)
+            failed[path] = modified
+
+
+# Started once per server process; runs in the background so no session
+# waits for every configured workbook to be parsed. Returns {path: mtime}
+# of workbooks that failed to load, which stay hidden until they change.
+@st.cache_resource
+def start_preload(paths):
+    failed = {}
+    thread = threading.Thread(
+        target=preload_workbooks, args=(paths, failed), name="preload-workbooks", daemon=True
+    )
+    thread.start()
+    return failed
 
-                    # Standardize case (vinay -> Vinay)
-                    first_name = first_name.lower().capitalize()
 
-                    final_rows.append({
-                        "Ticket Number": row_dict.get("Ticket Number"),
-                        "Assignee": first_name,
-                        "Effort": effort,
-                        "Month": current_month,
-                        "Week": current_week,
-                        "Client": sheet_name
-                    })
+def is_available(path, failed):
+    try:
+        return os.path.isfile(path) and failed.get(path) != os.path.getmtime(path)
+    except OSError:
+        return False
 
-    final_df = pd.DataFrame(final_rows)
 
-    month_order = {
-        "January": 1, "February": 2, "March": 3,
-        "April": 4, "May": 5, "June": 6,
-        "July": 7, "August": 8, "September": 9,
-        "October": 10, "November": 11, "December": 12
+def workbook_labels(paths):
+    # Show file names only; add the parent folder when two names collide
+    names = [os.path.basename(path) for path in paths]
+    return {
+        path: name if names.count(name) == 1
+        else os.path.join(os.path.basename(os.path.dirname(path)), name)
+        for path, name in zip(paths, names)
     }
 
-    final_df["Month_Num"] = final_df["Month"].map(month_order)
-    final_df["Week_Num"] = final_df["Week"].str.extract(r'(\d+)').astype(int)
-    final_df["Time_Order"] = final_df["Month_Num"] * 10 + final_df["Week_Num"]
-    final_df["Time_Label"] = final_df["Month"] + " " + final_df["Week"]
-
-    return final_df
-
 
 # ======================================================
 # UI
 # ======================================================
 
+failed_workbooks = start_preload(PRELOAD_WORKBOOKS)
+
 st.title("📊 Customer Ticket Effort Dashboard")
 
 uploaded_file = st.file_uploader("Upload Customer_Ticket_Status.xlsx", type=["xlsx"])
 
-if uploaded_file:
-    df = load_data(uploaded_file)
+preloaded = [path for path in PRELOAD_WORKBOOKS if is_available(path, failed_workbooks)]
+labels = workbook_labels(preloaded)
+
+source = uploaded_file
+if uploaded_file is None and preloaded:
+    source = st.selectbox(
+        "Or use a preloaded workbook",
+        options=preloaded,
+        format_func=labels.get
+    )
+
+if source:
+    if uploaded_file is None:
+        try:
+            dataset_key = (source, os.path.getmtime(source))
+            df = load_data(source, dataset_key[1])
+        except Exception:
+            logger.exception("Failed to load preloaded workbook: %s", source)
+            st.warning(f"Could not load {labels[source]}. Upload a workbook instead.")
+            st.stop()
+    else:
+        dataset_key = uploaded_file.file_id
+        df = load_data(uploaded_file)
+
+    index = build_filter_index(df, dataset_key)
 
     # ======================================================
     # SIDEBAR FILTERS
@@ -121,37 +154,24 @@ if uploaded_file:
 
     clients = st.sidebar.multiselect(
         "Select Client",
-        options=sorted(df["Client"].unique()),
-        default=sorted(df["Client"].unique())
+        options=index["clients"],
+        default=index["clients"]
     )
 
     assignees = st.sidebar.multiselect(
         "Select Assignee",
-        options=sorted(df["Assignee"].unique()),
-        default=sorted(df["Assignee"].unique())
+        options=index["assignees"],
+        default=index["assignees"]
     )
 
     months = st.sidebar.multiselect(
         "Select Month",
-        options=sorted(
-            df["Month"].dropna().unique(),
-            key=lambda x: df[df["Month"] == x]["Month_Num"].iloc[0]
-        ),
-        default=sorted(
-            df["Month"].dropna().unique(),
-            key=lambda x: df[df["Month"] == x]["Month_Num"].iloc[0]
-        )
+        options=index["months"],
+        default=index["months"]
     )
 
     # Build chronological week list AFTER month selection
-    week_timeline = (
-        df[df["Month"].isin(months)]
-        [["Time_Order", "Time_Label"]]
-        .drop_duplicates()
-        .sort_values("Time_Order")
-    )
-
-    week_order = week_timeline["Time_Label"].tolist()
+    week_order = week_order_for(index, months)
 
     selected_weeks = st.sidebar.multiselect(
         "Select Week",
@@ -159,23 +179,21 @@ if uploaded_file:
         default=week_order
     )
 
-    top_n = st.sidebar.slider("Show Top N Clients (by total effort)", 3, 20, 8)
+    top_n = st.sidebar.slider("Show Top N Clients (by total effort)", 3, 20, DEFAULT_TOP_N)
 
     # ======================================================
     # FILTER DATA
     # ======================================================
 
-    filtered_df = df[
-        (df["Client"].isin(clients)) &
-        (df["Assignee"].isin(assignees)) &
-        (df["Month"].isin(months)) &
-        (df["Time_Label"].isin(selected_weeks))
-    ]
+    filtered_df = apply_filters(df, clients, assignees, months, selected_weeks)
 
     if filtered_df.empty:
         st.warning("No data available for selected filters.")
         st.stop()
 
+    filters = (clients, assignees, months, selected_weeks)
+    aggregates = build_aggregates(filtered_df, dataset_key, filters, top_n, week_order)
+
     # ======================================================
     # KPI SECTION
     # ======================================================
@@ -193,12 +211,7 @@ if uploaded_file:
 
     st.subheader("Monthly Total Effort per Assignee")
 
-    monthly_assignee = (
-        filtered_df
-        .groupby("Assignee", as_index=False)
-        .agg({"Effort": "sum"})
-        .sort_values("Effort", ascending=False)
-    )
+    monthly_assignee = aggregates["monthly_assignee"]
 
     fig_bar = px.bar(
         monthly_assignee,
@@ -229,26 +242,7 @@ if uploaded_file:
 
     st.subheader("Monthly Total Effort per Client")
 
-    monthly_client = (
-        filtered_df
-        .groupby(["Month", "Month_Num", "Client"], as_index=False)
-        .agg({"Effort": "sum"})
-        .sort_values("Month_Num")
-    )
-
-    # Ensure chronological month ordering
-    month_order_sorted = (
-        monthly_client[["Month", "Month_Num"]]
-        .drop_duplicates()
-        .sort_values("Month_Num")["Month"]
-        .tolist()
-    )
-
-    monthly_client["Month"] = pd.Categorical(
-        monthly_client["Month"],
-        categories=month_order_sorted,
-        ordered=True
-    )
+    monthly_client = aggregates["monthly_client"]
 
     fig_month_client = px.bar(
         monthly_client,
@@ -280,12 +274,7 @@ if uploaded_file:
     if len(assignees) == 1 and len(clients) > 1:
         st.subheader(f"Client-wise Effort Distribution for {assignees[0]}")
 
-        assignee_client = (
-            filtered_df
-            .groupby("Client", as_index=False)
-            .agg({"Effort": "sum"})
-            .sort_values("Effort", ascending=False)
-        )
+        assignee_client = aggregates["assignee_client"]
 
         fig_assignee_client = px.bar(
             assignee_client,
@@ -309,30 +298,7 @@ if uploaded_file:
 
     st.subheader("Weekly Effort Trend per Client")
 
-    weekly = (
-        filtered_df
-        .groupby(["Time_Order", "Time_Label", "Client"], as_index=False)
-        .agg({"Effort": "sum"})
-        .sort_values("Time_Order")
-    )
-
-    # Top N clients
-    top_clients = (
-        filtered_df.groupby("Client")["Effort"]
-        .sum()
-        .sort_values(ascending=False)
-        .head(top_n)
-        .index
-    )
-
-    weekly = weekly[weekly["Client"].isin(top_clients)]
-
-    # Force chronological categorical ordering
-    weekly["Time_Label"] = pd.Categorical(
-        weekly["Time_Label"],
-        categories=week_order,
-        ordered=True
-    )
+    weekly = aggregates["weekly"]
 
     fig_line = px.line(
         weekly.sort_values("Time_Order"),
@@ -361,16 +327,7 @@ if uploaded_file:
 
     st.subheader("Weekly Effort Heatmap per Client")
 
-    pivot = (
-        weekly
-        .pivot_table(
-            values="Effort",
-            index="Client",
-            columns="Time_Label",
-            fill_value=0
-        )
-        .reindex(columns=week_order)
-    )
+    pivot = aggregates["pivot"]
 
     fig_heatmap = px.imshow(
         pivot,
@@ -388,6 +345,36 @@ if uploaded_file:
     st.subheader("Filtered Data")
     st.dataframe(filtered_df, use_container_width=True)
 
+    # ======================================================
+    # EXPORT
+    # ======================================================
+
+    st.subheader("⬇️ Export")
+
+    export_tables = {
+        "Filtered Data": filtered_df,
+        "Monthly Total Effort per Assignee": monthly_assignee,
+        "Monthly Total Effort per Client": monthly_client,
+        "Weekly Effort Trend per Client": weekly,
+        "Weekly Effort Heatmap per Client": pivot.reset_index(),
+    }
+
+    if len(assignees) == 1 and len(clients) > 1:
+        export_tables[f"Client-wise Effort Distribution for {assignees[0]}"] = assignee_client
+
+    export_col1, export_col2 = st.columns(2)
+    export_name = export_col1.selectbox("Table", options=list(export_tables))
+    export_format = export_col2.selectbox("Format", options=list(EXPORT_FORMATS))
+
+    # Serialized from the cached dataset only when the button is clicked
+    st.download_button(
+        f"Download {export_name} ({export_format})",
+        data=partial(export_file, export_tables[export_name], export_format),
+        file_name=export_filename(export_name, export_format),
+        mime=EXPORT_FORMATS[export_format]["mime"],
+        on_click="ignore"
+    )
+
     st.divider()
     st.subheader("📧 Email Report")
 
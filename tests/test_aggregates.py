@@ -0,0 +1,170 @@
+import pandas as pd
+import pytest
+
+from aggregates import apply_filters, chart_aggregates, filter_index, week_order_for
+from loader import parse_workbook
+
+
+@pytest.fixture
+def df(tmp_path):
+    workbook = tmp_path / "tickets.xlsx"
+    sheets = {
+        "Acme": [
+            ["February", "", ""],
+            ["Week 1", "", ""],
+            ["Ticket Number", "Assignee", "Effort"],
+            [1234, "vinay / Asha K", 3],
+            ["INC-55", "ravi", 2],
+            ["Week 2", "", ""],
+            [1240, "Meena", 5],
+            ["January", "", ""],
+            ["Week 3", "", ""],
+            [1100, "asha", 4],
+        ],
+        "Globex": [
+            ["January", "", ""],
+            ["Week 1", "", ""],
+            ["Ticket Number", "Assignee", "Effort"],
+            [2001, "Vinay", 1],
+            [2002, "Ravi, Sam", 6],
+            ["March", "", ""],
+            ["Week 4", "", ""],
+            [2003, "sam", 2],
+        ],
+        "Initech": [
+            ["March", "", ""],
+            ["Week 2", "", ""],
+            ["Ticket Number", "Assignee", "Effort"],
+            [3001, "Meena", 7],
+        ],
+    }
+    with pd.ExcelWriter(workbook) as writer:
+        for name, rows in sheets.items():
+            pd.DataFrame(rows).to_excel(writer, sheet_name=name, header=False, index=False)
+
+    return parse_workbook(workbook)
+
+
+# Reference implementations: the inline computations stream.py used before
+# they moved into aggregates.py
+
+def inline_options(df, months):
+    ordered_months = sorted(
+        df["Month"].dropna().unique(),
+        key=lambda x: df[df["Month"] == x]["Month_Num"].iloc[0]
+    )
+    week_order = (
+        df[df["Month"].isin(months)]
+        [["Time_Order", "Time_Label"]]
+        .drop_duplicates()
+        .sort_values("Time_Order")
+    )["Time_Label"].tolist()
+
+    return sorted(df["Client"].unique()), sorted(df["Assignee"].unique()), ordered_months, week_order
+
+
+def inline_aggregates(filtered_df, top_n, week_order):
+    monthly_assignee = (
+        filtered_df
+        .groupby("Assignee", as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Effort", ascending=False)
+    )
+
+    monthly_client = (
+        filtered_df
+        .groupby(["Month", "Month_Num", "Client"], as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Month_Num")
+    )
+    month_order_sorted = (
+        monthly_client[["Month", "Month_Num"]]
+        .drop_duplicates()
+        .sort_values("Month_Num")["Month"]
+        .tolist()
+    )
+    monthly_client["Month"] = pd.Categorical(
+        monthly_client["Month"], categories=month_order_sorted, ordered=True
+    )
+
+    assignee_client = (
+        filtered_df
+        .groupby("Client", as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Effort", ascending=False)
+    )
+
+    weekly = (
+        filtered_df
+        .groupby(["Time_Order", "Time_Label", "Client"], as_index=False)
+        .agg({"Effort": "sum"})
+        .sort_values("Time_Order")
+    )
+    top_clients = (
+        filtered_df.groupby("Client")["Effort"]
+        .sum()
+        .sort_values(ascending=False)
+        .head(top_n)
+        .index
+    )
+    weekly = weekly[weekly["Client"].isin(top_clients)]
+    weekly["Time_Label"] = pd.Categorical(
+        weekly["Time_Label"], categories=week_order, ordered=True
+    )
+
+    pivot = (
+        weekly
+        .pivot_table(values="Effort", index="Client", columns="Time_Label", fill_value=0)
+        .reindex(columns=week_order)
+    )
+
+    return {
+        "monthly_assignee": monthly_assignee,
+        "monthly_client": monthly_client,
+        "assignee_client": assignee_client,
+        "weekly": weekly,
+        "pivot": pivot,
+    }
+
+
+def test_filter_index_matches_inline_options(df):
+    index = filter_index(df)
+    clients, assignees, months, week_order = inline_options(df, ["January", "March"])
+
+    assert index["clients"] == clients
+    assert index["assignees"] == assignees
+    assert index["months"] == months == ["January", "February", "March"]
+    assert week_order_for(index, ["January", "March"]) == week_order
+
+
+@pytest.mark.parametrize("months, top_n", [
+    (["January", "February", "March"], 8),
+    (["January", "March"], 2),
+    (["February"], 1),
+])
+def test_chart_aggregates_match_inline_computations(df, months, top_n):
+    index = filter_index(df)
+    week_order = week_order_for(index, months)
+    filtered_df = apply_filters(df, index["clients"], index["assignees"], months, week_order)
+
+    result = chart_aggregates(filtered_df, top_n, week_order)
+    expected = inline_aggregates(filtered_df, top_n, week_order)
+
+    assert result.keys() == expected.keys()
+    for name in expected:
+        pd.testing.assert_frame_equal(result[name], expected[name])
+
+
+def test_apply_filters_matches_inline_mask(df):
+    clients, assignees, months = ["Acme", "Globex"], ["Asha", "Ravi"], ["January"]
+    selected_weeks = ["January Week1", "January Week3"]
+
+    expected = df[
+        (df["Client"].isin(clients)) &
+        (df["Assignee"].isin(assignees)) &
+        (df["Month"].isin(months)) &
+        (df["Time_Label"].isin(selected_weeks))
+    ]
+
+    pd.testing.assert_frame_equal(apply_filters(df, clients, assignees, months, selected_weeks), expected)
+    assert len(expected) == 2
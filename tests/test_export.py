@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from export import export_file, export_filename, iter_export
+
+
+def sample_df(rows=25):
+    df = pd.DataFrame({
+        "Ticket Number": [1000 + i if i % 3 else f"INC-{i}" for i in range(rows)],
+        "Assignee": ["Vinay", "Asha", "Ravi", "Meena", "Sam"] * (rows // 5),
+        "Effort": np.arange(rows, dtype=float),
+        "Month": ["January"] * rows,
+    })
+    df["Month"] = pd.Categorical(df["Month"], categories=["January", "February"], ordered=True)
+    return df
+
+
+def test_csv_round_trip_in_chunks():
+    df = sample_df()
+
+    chunks = list(iter_export(df, "CSV", chunk_rows=10))
+    result = pd.read_csv(export_file(df, "CSV", chunk_rows=10))
+
+    # Header plus three data chunks
+    assert len(chunks) == 4
+    assert result["Ticket Number"].astype(str).tolist() == df["Ticket Number"].astype(str).tolist()
+    assert result["Effort"].tolist() == df["Effort"].tolist()
+
+
+def test_parquet_round_trip_writes_one_row_group_per_chunk():
+    df = sample_df()
+
+    file = export_file(df, "Parquet", chunk_rows=10)
+    parquet = pq.ParquetFile(file)
+    result = parquet.read().to_pandas()
+
+    assert parquet.num_row_groups == 3
+    assert result["Ticket Number"].tolist() == df["Ticket Number"].astype(str).tolist()
+    assert result["Effort"].tolist() == df["Effort"].tolist()
+
+
+def test_arrow_round_trip_writes_one_batch_per_chunk():
+    df = sample_df()
+
+    reader = pa.ipc.open_file(export_file(df, "Arrow IPC", chunk_rows=10))
+    result = reader.read_all().to_pandas()
+
+    assert reader.num_record_batches == 3
+    assert result["Assignee"].tolist() == df["Assignee"].tolist()
+
+
+@pytest.mark.parametrize("fmt", ["Parquet", "Arrow IPC"])
+def test_categorical_columns_are_written_as_values(fmt):
+    df = sample_df()
+
+    file = export_file(df, fmt, chunk_rows=10)
+    table = pq.read_table(file) if fmt == "Parquet" else pa.ipc.open_file(file).read_all()
+
+    assert table.schema.field("Month").type == pa.string()
+    assert table.column("Month").to_pylist() == ["January"] * len(df)
+
+
+@pytest.mark.parametrize("fmt", ["Parquet", "Arrow IPC"])
+def test_mixed_type_columns_are_written_as_strings(fmt):
+    df = pd.DataFrame({"Ticket Number": [1234, "INC-55", np.nan]})
+
+    file = export_file(df, fmt)
+    table = pq.read_table(file) if fmt == "Parquet" else pa.ipc.open_file(file).read_all()
+
+    assert table.column("Ticket Number").to_pylist() == ["1234", "INC-55", None]
+
+
+def test_empty_frame_keeps_columns():
+    df = sample_df().iloc[:0]
+
+    assert pd.read_csv(export_file(df, "CSV")).columns.tolist() == df.columns.tolist()
+    assert pq.read_table(export_file(df, "Parquet")).num_rows == 0
+    assert pa.ipc.open_file(export_file(df, "Arrow IPC")).read_all().column_names == df.columns.tolist()
+
+
+def test_unsupported_format_raises():
+    with pytest.raises(ValueError):
+        iter_export(sample_df(), "Excel")
+
+
+def test_export_filename():
+    assert export_filename("Weekly Effort Trend per Client", "Parquet") == "weekly_effort_trend_per_client.parquet"
+
+
+def test_cli_writes_parsed_workbook(tmp_path):
+    from export import main
+
+    workbook = tmp_path / "tickets.xlsx"
+    sheet = pd.DataFrame([
+        ["January", "", ""],
+        ["Week 1", "", ""],
+        ["Ticket Number", "Assignee", "Effort"],
+        [1234, "vinay / Asha K", 3],
+        ["INC-55", "ravi", 2],
+    ])
+    sheet.to_excel(workbook, sheet_name="Acme", header=False, index=False)
+
+    output = tmp_path / "tickets.parquet"
+    main([str(workbook), str(output)])
+    result = pd.read_parquet(output)
+
+    assert result["Assignee"].tolist() == ["Vinay", "Asha", "Ravi"]
+    assert result["Ticket Number"].tolist() == ["1234", "1234", "INC-55"]
+    assert result["Time_Label"].unique().tolist() == ["January Week1"]
+
+
+@pytest.mark.parametrize("fmt", ["CSV", "Parquet", "Arrow IPC"])
+def test_chunks_are_never_empty(fmt):
+    assert all(list(iter_export(sample_df(), fmt, chunk_rows=10)))